@@ -1,4 +1,38 @@
 from shared_functions import *
+import os
+import pickle
+
+# Sidecar cache for demo query embeddings. The demonstration queries are
+# identical on every launch, so their vectors are persisted across restarts
+# instead of being re-embedded each run.
+DEMO_EMBEDDING_CACHE = './cache/demo_embeds.pkl'
+
+def _load_or_compute_query_embeddings(queries):
+    """Return embeddings for queries, served from the on-disk cache when possible.
+
+    The cache file maps query string -> embedding vector (plain lists, so the
+    pickle stays loadable without numpy). Missing queries are embedded once
+    and the cache is rewritten.
+    """
+    cached = {}
+    try:
+        with open(DEMO_EMBEDDING_CACHE, 'rb') as cache_file:
+            cached = pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        cached = {}
+
+    missing = [q for q in queries if q not in cached]
+    if missing:
+        embeddings = get_embedding_model().encode(missing, normalize_embeddings=True)
+        cached.update({query: vector.tolist() for query, vector in zip(missing, embeddings)})
+        try:
+            os.makedirs(os.path.dirname(DEMO_EMBEDDING_CACHE), exist_ok=True)
+            with open(DEMO_EMBEDDING_CACHE, 'wb') as cache_file:
+                pickle.dump(cached, cache_file)
+        except OSError:
+            pass  # Cache is an optimization only; keep going without it
+
+    return [cached[q] for q in queries]
 
 def main():
     """Main function for advanced search demonstrations"""
@@ -209,29 +243,33 @@ def run_search_demonstrations(collection):
         }
     ]
     
-    for i, demo in enumerate(demonstrations, 1):
+    # Run all demo queries as one batched Chroma call (one embedding pass,
+    # one index traversal) instead of a search per demonstration
+    queries = [demo['query'] for demo in demonstrations]
+    query_filters = [
+        {'cuisine_filter': demo['cuisine_filter'], 'max_calories': demo['max_calories']}
+        for demo in demonstrations
+    ]
+    batched_results = perform_similarity_search_batch(
+        collection, queries, n_results=3, filters=query_filters,
+        query_embeddings=_load_or_compute_query_embeddings(queries)
+    )
+
+    for i, (demo, results) in enumerate(zip(demonstrations, batched_results), 1):
         print(f"\n{i}. {demo['title']}")
         print(f"   Query: '{demo['query']}'")
-        
+
         filters = []
         if demo['cuisine_filter']:
             filters.append(f"Cuisine: {demo['cuisine_filter']}")
         if demo['max_calories']:
             filters.append(f"Max Calories: {demo['max_calories']}")
-        
+
         if filters:
             print(f"   Filters: {', '.join(filters)}")
-        
-        results = perform_filtered_similarity_search(
-            collection,
-            demo['query'],
-            cuisine_filter=demo['cuisine_filter'],
-            max_calories=demo['max_calories'],
-            n_results=3
-        )
-        
+
         display_search_results(results, demo['title'], show_details=False)
-        
+
         input("\n⏸️  Press Enter to continue to next demonstration...")
 
 def display_search_results(results, title, show_details=True):
@@ -1,9 +1,26 @@
 from shared_functions import *
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
 from transformers import pipeline, Pipeline
 import json
+import os
 import chromadb
 
+# Pin torch's thread pools before any model work: one intra-op thread per
+# core for the GEMM-heavy decode loop, and a single inter-op thread since
+# generation runs one op graph at a time (oversubscription only adds
+# scheduler churn). Must happen before torch spins up its default pools.
+try:
+    import torch
+    torch.set_num_threads(max(1, os.cpu_count() or 1))
+    torch.set_num_interop_threads(1)
+except Exception:
+    pass
+
+# Single background worker for LLM generation. Generation runs while the
+# chat thread prints retrieval details, overlapping model latency with I/O.
+_llm_executor = ThreadPoolExecutor(max_workers=1)
+
 # For simplicity and reliability, use direct Transformers pipeline
 # This avoids LangChain version compatibility issues
 print("🔧 Using direct Transformers pipeline for maximum compatibility")
@@ -20,14 +37,99 @@ generation_params: Dict[str, Union[int, float, bool]] = {
     "top_p": 0.9
 }
 
+def build_llm_pipeline(model_name: str) -> Pipeline:
+    """
+    Build the text generation pipeline, preferring an AOT-compiled backend.
+
+    On CPU the stock PyTorch eager path leaves throughput on the table for
+    FLAN-T5's GEMM-heavy decode loop. ONNX Runtime runs an ahead-of-time
+    exported graph with fused kernels and MKL/DNNL GEMMs, which cuts
+    per-generation latency substantially — important because the chat loop
+    blocks on every turn. Falls back to the plain PyTorch pipeline when
+    optimum/onnxruntime is not available.
+
+    Args:
+        model_name: Hugging Face model identifier to load
+
+    Returns:
+        A text2text-generation pipeline ready for generate_text()
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        from transformers import AutoTokenizer
+
+        ort_model = ORTModelForSeq2SeqLM.from_pretrained(
+            model_name, export=True, provider="CPUExecutionProvider"
+        )
+        ort_model = _quantize_ort_model(ort_model, model_name)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        print("✅ Using ONNX Runtime backend (AOT-exported graph)")
+        return pipeline("text2text-generation", model=ort_model, tokenizer=tokenizer)
+    except Exception as e:
+        print(f"⚠️  ONNX Runtime backend unavailable ({e}), using PyTorch")
+
+    # bfloat16 weights halve memory bandwidth on the decode loop; keep fp32
+    # only if this torch build lacks bf16 CPU support. low_cpu_mem_usage is
+    # deliberately not passed: it targets sharded multi-GB checkpoints and
+    # only adds meta-device bookkeeping for a model of this size.
+    model_kwargs: Dict[str, Any] = {}
+    try:
+        import torch
+        if hasattr(torch, 'bfloat16'):
+            model_kwargs["torch_dtype"] = torch.bfloat16
+    except Exception:
+        pass
+
+    return pipeline(
+        "text2text-generation",
+        model=model_name,
+        device="cpu",  # Use CPU for local compatibility
+        model_kwargs=model_kwargs
+    )
+
+def _quantize_ort_model(ort_model, model_name: str):
+    """
+    Dynamically quantize an exported ONNX model's weights to int8.
+
+    Weight matrices dominate the memory traffic of CPU generation; int8
+    dynamic quantization halves (vs bf16) or quarters (vs fp32) the bytes
+    moved per GEMM and lets ONNX Runtime use VNNI int8 kernels on modern
+    x86. Returns the original model untouched if quantization fails, since
+    fp32 ONNX is still faster than eager PyTorch.
+
+    Args:
+        ort_model: Exported ORTModelForSeq2SeqLM instance
+        model_name: Model identifier, used to name the quantized cache dir
+
+    Returns:
+        The int8-quantized model, or the input model on failure
+    """
+    try:
+        from pathlib import Path
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        save_dir = Path('./cache') / f"{model_name.replace('/', '_')}_onnx_int8"
+        if not save_dir.exists():
+            export_dir = Path('./cache') / f"{model_name.replace('/', '_')}_onnx_fp32"
+            ort_model.save_pretrained(export_dir)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False)
+            for onnx_file in sorted(export_dir.glob('*.onnx')):
+                quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=onnx_file.name)
+                quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+
+        quantized = ORTModelForSeq2SeqLM.from_pretrained(
+            save_dir, provider="CPUExecutionProvider"
+        )
+        print("✅ Loaded int8-quantized ONNX weights")
+        return quantized
+    except Exception as e:
+        print(f"⚠️  int8 quantization unavailable ({e}), using fp32 ONNX model")
+        return ort_model
+
 # Initialize the Hugging Face LLM model
 print("🔧 Initializing Hugging Face LLM...")
-llm_pipeline = pipeline(
-    "text2text-generation",
-    model=model_id,
-    device="cpu",  # Use CPU for local compatibility
-    model_kwargs={"low_cpu_mem_usage": True}
-)
+llm_pipeline = build_llm_pipeline(model_id)
 
 # Simple function to call the model
 def generate_text(prompt: str) -> str:
@@ -88,34 +190,116 @@ def main() -> None:
 
 
 
-def generate_llm_rag_response(query: str, search_results: List[Dict[str, Any]]) -> str:
-    """Generate response using FLAN-T5 with retrieved context"""
-    if not search_results:
-        return "I couldn't find any food items matching your request. Try describing what you're in the mood for with different words!"
-    
-    # Build simplified context
+# Static skeleton of the RAG prompt, defined once at module scope. FLAN-T5 is
+# an encoder-decoder model, so decoder-style KV-cache reuse of a shared prefix
+# is not available — the encoder re-reads the full prompt each call. The
+# practical equivalent is keeping the static part of the prompt fixed and
+# minimal so the per-call encode cost stays dominated by the dynamic context.
+RAG_PROMPT_TEMPLATE = "User wants: {query}\nAvailable foods: {context}\nRecommend 2-3 foods and explain why:"
+
+# When the best retrieval hit is this similar to the query, the match is
+# effectively exact (e.g. the user typed a dish name) and a templated answer
+# reads as well as a generated one — skip the LLM call entirely.
+LLM_BYPASS_SIMILARITY = 0.85
+
+# Longest wait (seconds) for the next streamed fragment. Bounds every queue
+# read in the drain loop: if the worker dies without closing the stream, the
+# loop raises instead of blocking forever on an empty queue.
+STREAM_FRAGMENT_TIMEOUT = 60.0
+
+# Responses at or below this length are junk (stray tokens, empty decode);
+# callers show the templated fallback instead. Streaming holds back this many
+# characters before printing so a thin response never reaches the terminal.
+MIN_LLM_RESPONSE_CHARS = 20
+
+def _warm_prompt_tokenization() -> None:
+    """Pre-tokenize the static prompt skeleton to warm the tokenizer caches.
+
+    The first tokenizer call pays lazy initialization (merges table, special
+    token handling); doing it at startup keeps that cost out of the first
+    chat turn.
+    """
+    try:
+        tokenizer = getattr(llm_pipeline, 'tokenizer', None)
+        if tokenizer is not None:
+            tokenizer(RAG_PROMPT_TEMPLATE.format(query='', context=''))
+    except Exception:
+        pass  # Warmup is best-effort only
+
+_warm_prompt_tokenization()
+
+def _build_rag_prompt(query: str, search_results: List[Dict[str, Any]]) -> str:
+    """Build the RAG prompt from the static skeleton and retrieved context."""
     foods = []
     for result in search_results[:3]:
         food_info = f"{result['food_name']} ({result['cuisine_type']}, {result['food_calories_per_serving']} cal)"
         foods.append(food_info)
-    
-    context = ", ".join(foods)
-    
-    # Simple, effective prompt
-    prompt = f"User wants: {query}\nAvailable foods: {context}\nRecommend 2-3 foods and explain why:"
-    
+
+    return RAG_PROMPT_TEMPLATE.format(query=query, context=", ".join(foods))
+
+def generate_text_streaming(prompt: str) -> str:
+    """
+    Generate text while printing tokens to stdout as they are produced.
+
+    Streaming surfaces the first words after the first decode step instead
+    of after full generation, cutting perceived latency on every chat turn.
+    Generation runs on the background worker and the chat thread drains the
+    token stream; falls back to blocking generation (printing the complete
+    response at once) when the backend cannot stream. The first
+    MIN_LLM_RESPONSE_CHARS are held back before printing, so a thin junk
+    response never reaches the terminal and the caller can show the
+    templated fallback on a clean line.
+
+    Args:
+        prompt: Input text prompt for generation
+
+    Returns:
+        The complete generated text (printed only if longer than
+        MIN_LLM_RESPONSE_CHARS)
+    """
+    pieces: List[str] = []
+    printed = False
     try:
+        import queue
+
+        from transformers import TextIteratorStreamer
+
+        streamer = TextIteratorStreamer(
+            llm_pipeline.tokenizer, skip_prompt=True, skip_special_tokens=True,
+            timeout=STREAM_FRAGMENT_TIMEOUT
+        )
+        future = _llm_executor.submit(
+            llm_pipeline, prompt, streamer=streamer, **generation_params
+        )
+
+        buffered = 0
+        try:
+            for fragment in streamer:
+                pieces.append(fragment)
+                buffered += len(fragment)
+                if printed:
+                    print(fragment, end='', flush=True)
+                elif buffered > MIN_LLM_RESPONSE_CHARS:
+                    # Enough text to be a real response; flush the held-back
+                    # prefix and stream the rest as it arrives
+                    print(''.join(pieces), end='', flush=True)
+                    printed = True
+        except queue.Empty:
+            # The worker stopped feeding the stream without closing it
+            # (generation failed before reaching streamer.end()); surface
+            # its error through future.result() below
+            pass
+        future.result(timeout=STREAM_FRAGMENT_TIMEOUT)  # Surface generation errors
+        if printed:
+            print()
+        return ''.join(pieces).strip()
+    except Exception:
+        if printed:
+            print()  # Partial fragments were printed; break the line first
         response = generate_text(prompt)
-        if response and len(response.strip()) > 20:
-            return response
-        else:
-            # Fallback response
-            top = search_results[0]
-            return f"I recommend {top['food_name']}, a {top['cuisine_type']} dish with {top['food_calories_per_serving']} calories. It matches your request for '{query}'."
-    except Exception as e:
-        print(f"❌ LLM Error: {e}")
-        top = search_results[0]
-        return f"I recommend {top['food_name']}, a {top['cuisine_type']} dish with {top['food_calories_per_serving']} calories."
+        if response and len(response.strip()) > MIN_LLM_RESPONSE_CHARS:
+            print(response)
+        return response
 
 def generate_fallback_response(query: str, search_results: List[Dict]) -> str:
     """Generate fallback response when LLM fails"""
@@ -202,12 +386,7 @@ def handle_enhanced_rag_query(collection: chromadb.Collection, query: str, conve
     
     print(f"✅ Found {len(search_results)} relevant matches")
     print("🧠 Generating AI-powered response...")
-    
-    # Generate enhanced RAG response using FLAN-T5
-    ai_response = generate_llm_rag_response(query, search_results)
-    
-    print(f"\n🤖 Bot: {ai_response}")
-    
+
     # Show detailed results for reference
     print(f"\n📊 Search Results Details:")
     print("-" * 45)
@@ -217,6 +396,22 @@ def handle_enhanced_rag_query(collection: chromadb.Collection, query: str, conve
         if i < 3:
             print()
 
+    # Near-exact match: answer from the template and skip generation, which
+    # saves the full LLM latency on queries that name a dish outright
+    if search_results[0]['similarity_score'] >= LLM_BYPASS_SIMILARITY:
+        print(f"\n🤖 Bot: {generate_fallback_response(query, search_results)}")
+        return
+
+    # Stream the AI response token by token; the first words appear after
+    # the first decode step instead of after full generation
+    print(f"\n🤖 Bot: ", end='', flush=True)
+    ai_response = generate_text_streaming(_build_rag_prompt(query, search_results))
+
+    if not ai_response or len(ai_response) <= MIN_LLM_RESPONSE_CHARS:
+        # Streamed output was empty or too thin; nothing was printed (the
+        # stream holds back that many chars), so only the template shows
+        print(generate_fallback_response(query, search_results))
+
 def handle_enhanced_comparison_mode(collection: chromadb.Collection) -> None:
     """Enhanced comparison between two food queries using LLM."""
     print("\n🔄 ENHANCED COMPARISON MODE")
@@ -232,27 +427,29 @@ def handle_enhanced_comparison_mode(collection: chromadb.Collection) -> None:
     
     print(f"\n🔍 Analyzing '{query1}' vs '{query2}' with AI...")
     
-    # Get results for both queries
-    results1 = perform_similarity_search(collection, query1, 3)
-    results2 = perform_similarity_search(collection, query2, 3)
-    
-    # Generate AI-powered comparison
-    comparison_response = generate_llm_comparison(query1, query2, results1, results2)
-    
-    print(f"\n🤖 AI Analysis: {comparison_response}")
-    
+    # Get results for both queries with a single batched Chroma call
+    results1, results2 = perform_similarity_search_batch(collection, [query1, query2], 3)
+
+    # Start the AI comparison on the background worker; the side-by-side
+    # table prints while the model generates
+    comparison_future = _llm_executor.submit(
+        generate_llm_comparison, query1, query2, results1, results2
+    )
+
     # Show side-by-side results
     print(f"\n📊 DETAILED COMPARISON")
     print("=" * 60)
     print(f"{'Query 1: ' + query1[:20] + '...' if len(query1) > 20 else 'Query 1: ' + query1:<30} | {'Query 2: ' + query2[:20] + '...' if len(query2) > 20 else 'Query 2: ' + query2}")
     print("-" * 60)
-    
+
     max_results = max(len(results1), len(results2))
     for i in range(min(max_results, 3)):
         left = f"{results1[i]['food_name']} ({results1[i]['similarity_score']*100:.0f}%)" if i < len(results1) else "---"
         right = f"{results2[i]['food_name']} ({results2[i]['similarity_score']*100:.0f}%)" if i < len(results2) else "---"
         print(f"{left[:30]:<30} | {right[:30]}")
 
+    print(f"\n🤖 AI Analysis: {comparison_future.result()}")
+
 def generate_llm_comparison(query1: str, query2: str, results1: List[Dict[str, Any]], results2: List[Dict[str, Any]]) -> str:
     """Generate AI-powered comparison between two queries"""
     # Simple fallback if no results
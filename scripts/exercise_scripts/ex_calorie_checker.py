@@ -41,14 +41,14 @@ def calorie_checker():
             print("Please enter a food to search for!")
             continue
         
-        # Search for foods within budget
-        budget_results = perform_filtered_similarity_search(
-            collection, search_term, max_calories=budget, n_results=5
-        )
-        
-        # Also get regular results to show what's over budget
-        all_results = perform_similarity_search(collection, search_term, 5)
-        
+        # One search covers both views: the unfiltered results already carry
+        # calorie metadata, so the budget split is a Python partition instead
+        # of a second embedding pass + index traversal. Fetch a few extra
+        # results to compensate for budget rejections.
+        all_results = perform_similarity_search(collection, search_term, 10)
+        budget_results = [r for r in all_results
+                          if r['food_calories_per_serving'] <= budget][:5]
+
         print(f"\n📋 Results for '{search_term}':")
         
         if budget_results:
@@ -62,12 +62,10 @@ def calorie_checker():
         else:
             print(f"❌ No foods found within your {budget} calorie budget!")
         
-        # Show over-budget options
-        over_budget = []
-        for result in all_results:
-            if result['food_calories_per_serving'] > budget:
-                over_budget.append(result)
-        
+        # Show over-budget options from the same result set
+        over_budget = [r for r in all_results
+                       if r['food_calories_per_serving'] > budget][:3]
+
         if over_budget:
             print(f"\n🚫 OVER BUDGET (but similar to your search):")
             for i, result in enumerate(over_budget[:3], 1):
@@ -1,14 +1,19 @@
 import sys
 import os
-from typing import List, Dict, Any
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Dict, Any
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from shared_functions import *
 import chromadb
 
-# Global variables to store loaded food items and search history
-food_items: List[Dict[str, Any]] = []
-search_history: List[str] = []
-search_history = []
+@dataclass
+class _State:
+    """Session state: loaded food items and a bounded search history."""
+    food_items: List[Dict[str, Any]] = field(default_factory=list)
+    # deque(maxlen=...) keeps appends O(1) and the history bounded over a
+    # long session instead of growing without limit
+    search_history: Deque[str] = field(default_factory=lambda: deque(maxlen=100))
 
 def main() -> None:
     """Main function for interactive CLI food recommendation system."""
@@ -16,26 +21,25 @@ def main() -> None:
         print("🍽️  Interactive Food Recommendation System")
         print("=" * 50)
         print("Loading food database...")
-        
+
         # Load food data from file
-        global food_items
-        global search_history
-        food_items = load_food_data('././data/FoodDataSet.json')
-        print(f"✅ Loaded {len(food_items)} food items successfully")
-        
+        state = _State()
+        state.food_items = load_food_data('././data/FoodDataSet.json')
+        print(f"✅ Loaded {len(state.food_items)} food items successfully")
+
         # Create and populate search collection
         collection = create_similarity_search_collection(
             "interactive_food_search",
             {'description': 'A collection for interactive food search'}
         )
-        populate_similarity_collection(collection, food_items)
-        
+        populate_similarity_collection(collection, state.food_items)
+
         # Start interactive chatbot
-        interactive_food_chatbot(collection)
-        
+        interactive_food_chatbot(state, collection)
+
     except Exception as error:
         print(f"❌ Error initializing system: {error}")
-def interactive_food_chatbot(collection: chromadb.Collection) -> None:
+def interactive_food_chatbot(state: _State, collection: chromadb.Collection) -> None:
     """Interactive CLI chatbot for food recommendations."""
     print("\n" + "="*50)
     print("🤖 INTERACTIVE FOOD SEARCH CHATBOT")
@@ -68,11 +72,11 @@ def interactive_food_chatbot(collection: chromadb.Collection) -> None:
                 show_help_menu()
             
             elif user_input.lower() in ['history']:
-                handle_history_command()
-            
+                handle_history_command(state)
+
             # Handle food search
             else:
-                handle_food_search(collection, user_input)
+                handle_food_search(state, collection, user_input)
                 
         except KeyboardInterrupt:
             print("\n\n👋 System interrupted. Goodbye!")
@@ -92,9 +96,9 @@ def show_help_menu() -> None:
     print("\nCommands:")
     print("  • 'help' - Show this help menu")
     print("  • 'quit' - Exit the system")
-def handle_food_search(collection, query):
+def handle_food_search(state: _State, collection, query):
     """Handle food similarity search with enhanced display"""
-    search_history.append(query)
+    state.search_history.append(query)
     print(f"\n🔍 Searching for '{query}'...")
     print("   Please wait...")
     
@@ -149,15 +153,16 @@ def suggest_related_searches(results: List[Dict[str, Any]]) -> None:
         print("   • Try 'low calorie' for lighter options")
     else:
         print("   • Try 'hearty meal' for more substantial dishes")
-def handle_history_command():
+def handle_history_command(state: _State):
     """Display user's search history"""
-    if not search_history:
+    if not state.search_history:
         print("📝 No search history available")
         return
-    
+
     print("\n📝 Your Search History:")
     print("-" * 30)
-    for i, search in enumerate(search_history[-10:], 1):  # Show last 10
+    recent = list(state.search_history)[-10:]  # Show last 10
+    for i, search in enumerate(recent, 1):
         print(f"{i}. {search}")
 if __name__ == "__main__":
     main()
\ No newline at end of file
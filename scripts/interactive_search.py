@@ -40,30 +40,38 @@ def interactive_food_chatbot(collection):
     print("  • Ctrl+C - Emergency exit")
     print("-" * 50)
     
+    last_query = None
+
     while True:
         try:
             # Get user input
             user_input = input("\n🔍 Search for food: ").strip()
-            
+
             # Handle empty input
             if not user_input:
                 print("   Please enter a search term or 'help' for commands")
                 continue
-            
+
             # Handle exit commands
             if user_input.lower() in ['quit', 'exit', 'q']:
                 print("\n👋 Thank you for using the Food Recommendation System!")
                 print("   Goodbye!")
                 break
-            
+
             # Handle help command
             elif user_input.lower() in ['help', 'h']:
                 show_help_menu()
-            
+
             # Handle food search
             else:
-                handle_food_search(collection, user_input)
-                
+                # Normalize casing/whitespace so retries of the same phrase
+                # share one cache entry instead of re-querying ChromaDB
+                normalized_query = ' '.join(user_input.lower().split())
+                if normalized_query == last_query:
+                    print("   (repeating your last search — served from cache)")
+                handle_food_search(collection, normalized_query)
+                last_query = normalized_query
+
         except KeyboardInterrupt:
             print("\n\n👋 System interrupted. Goodbye!")
             break
@@ -128,15 +136,21 @@ def suggest_related_searches(results):
     if not results:
         return
     
-    # Extract cuisine types from results
-    cuisines = list(set([r['cuisine_type'] for r in results]))
-    
+    # Collect unique cuisines and total calories in a single pass; a dict
+    # preserves the ranking order of the results, so the suggestions lead
+    # with the cuisines of the best matches
+    seen_cuisines = {}
+    total_calories = 0
+    for r in results:
+        seen_cuisines.setdefault(r['cuisine_type'], None)
+        total_calories += r['food_calories_per_serving']
+
     print("\n💡 Related searches you might like:")
-    for cuisine in cuisines[:3]:  # Limit to 3 suggestions
+    for cuisine in list(seen_cuisines)[:3]:  # Limit to 3 suggestions
         print(f"   • Try '{cuisine} dishes' for more {cuisine} options")
-    
+
     # Suggest calorie-based searches
-    avg_calories = sum([r['food_calories_per_serving'] for r in results]) / len(results)
+    avg_calories = total_calories / len(results)
     if avg_calories > 350:
         print("   • Try 'low calorie' for lighter options")
     else:
@@ -18,14 +18,84 @@ Last Updated: $(date)
 
 import json
 import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Union
 import chromadb
-from sentence_transformers import SentenceTransformer
+import numpy as np
+
+try:
+    import orjson  # Optional: C-backed JSON parser, several times faster than stdlib
+except ImportError:
+    orjson = None
+
+from flat_index import FlatVectorIndex
 
 # Global embedding model instance for consistency across the application
 _embedding_model = None
 
-def get_embedding_model(model_name: str = "all-MiniLM-L6-v2") -> SentenceTransformer:
+# Maximum number of items sent to ChromaDB in a single add() call. One
+# batched call handles the bundled dataset; larger corpora are chunked to
+# stay under the client's per-request batch limit.
+ADD_BATCH_SIZE = 1000
+
+# Memoized datasets keyed by absolute file path: (mtime, validated items).
+# Scripts that build several collections from the same file parse and
+# validate it only once per process.
+_food_data_cache: Dict[str, Any] = {}
+
+# Collections registered for cached searching, keyed by collection name.
+# lru_cache requires hashable arguments, so cached lookups pass the name
+# and resolve the live collection object through this registry.
+_search_collections: Dict[str, chromadb.Collection] = {}
+
+# On-disk location for the persistent ChromaDB store. Keeping collections
+# (and their embeddings) across restarts lets the warm-start check in
+# populate_similarity_collection skip the embedding pass entirely.
+CHROMA_PERSIST_PATH = './cache/chroma'
+
+# Singleton ChromaDB client shared by every collection in the process
+_chroma_client = None
+
+# LRU cache of query embeddings. The result cache above it is keyed on
+# (query, filters, n_results), so the same query with a different filter or
+# result count misses there but still skips the embedding pass here.
+_query_embedding_cache: 'OrderedDict[str, List[float]]' = OrderedDict()
+QUERY_EMBEDDING_CACHE_SIZE = 256
+
+# Structure-of-arrays columns per collection name, built at population time.
+# Filter prechecks scan these contiguous arrays instead of the list of dicts.
+_food_columns: Dict[str, Dict[str, np.ndarray]] = {}
+
+# Worker pool backing perform_similarity_search_async(). Two workers cover
+# a search overlapping with terminal rendering plus one queued follow-up.
+_query_pool = ThreadPoolExecutor(max_workers=2)
+
+# HNSW index settings applied to every collection. The dataset is a few
+# hundred vectors, so a modest graph degree (M) with generous build/search
+# candidate lists (ef) gives effectively exact recall while keeping inserts
+# and queries cheap. Stored and query vectors are L2-normalized at encode
+# time, so inner product equals cosine similarity and the 'ip' space skips
+# the per-vector normalization cosine would redo inside the C++ hot path;
+# distances stay 1 - similarity, matching _format_result_row().
+HNSW_INDEX_SETTINGS = {
+    'hnsw:space': 'ip',
+    'hnsw:M': 16,
+    'hnsw:construction_ef': 200,
+    'hnsw:search_ef': 100
+}
+
+# Corpora at or below this size are also kept in a FlatVectorIndex and
+# searched exactly, which beats the HNSW round-trip for a few hundred
+# vectors.
+FLAT_SEARCH_MAX_ITEMS = 2000
+
+# In-memory flat indexes per collection name, built at population time
+_flat_stores: Dict[str, FlatVectorIndex] = {}
+
+def get_embedding_model(model_name: str = "all-MiniLM-L6-v2") -> Union['SentenceTransformer', '_OnnxEmbeddingModel']:
     """
     Get or create a singleton embedding model instance.
     
@@ -45,12 +115,145 @@ def get_embedding_model(model_name: str = "all-MiniLM-L6-v2") -> SentenceTransfo
         >>> embeddings = embedder.encode(["pasta", "pizza"])
         >>> print(f"Generated {len(embeddings)} embeddings")
         Generated 2 embeddings
+
+    Note:
+        - When a CUDA GPU (or Apple MPS) is available the model runs there,
+          with fp16 weights on CUDA to halve memory traffic
+        - On CPU the tokenizer + ONNX Runtime path is preferred when
+          optimum/onnxruntime is installed; both backends expose the same
+          encode() interface and produce equivalent normalized vectors
     """
     global _embedding_model
     if _embedding_model is None:
-        _embedding_model = SentenceTransformer(model_name)
+        device = _detect_embedding_device()
+        if device is None:
+            # CPU: prefer the direct tokenizer + ONNX Runtime path, which
+            # skips SentenceTransformer's module stack and runs an
+            # AOT-exported graph with fused kernels
+            _embedding_model = _try_onnx_embedding_model(model_name)
+        if _embedding_model is None:
+            # Deferred import: sentence_transformers pulls in torch, so
+            # paying it only when the ONNX path is unavailable keeps both
+            # warm-start runs and ONNX-backed runs fast
+            from sentence_transformers import SentenceTransformer
+
+            _embedding_model = SentenceTransformer(model_name, device=device)
+            if device == 'cuda':
+                # fp16 halves weight memory traffic; CUDA kernels handle it natively
+                _embedding_model.half()
     return _embedding_model
 
+class _OnnxEmbeddingModel:
+    """
+    Direct tokenizer + ONNX Runtime embedding path.
+
+    Mirrors SentenceTransformer.encode() for this model family (mean pooling
+    over the last hidden state, L2 normalization) while running the
+    transformer through an AOT-exported ONNX graph — no PyTorch module
+    stack or per-call Python dispatch between layers.
+    """
+
+    def __init__(self, model_name: str):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        model_id = f"sentence-transformers/{model_name}"
+        self._tokenizer = AutoTokenizer.from_pretrained(model_id)
+        self._model = ORTModelForFeatureExtraction.from_pretrained(
+            model_id, export=True, provider="CPUExecutionProvider"
+        )
+
+    def encode(self, sentences: Union[str, List[str]], **kwargs) -> np.ndarray:
+        """
+        Encode text(s) into L2-normalized embedding vectors.
+
+        Args:
+            sentences: A string or list of strings to embed
+            **kwargs: Accepted for SentenceTransformer.encode() call
+                     compatibility (e.g. show_progress_bar); ignored
+
+        Returns:
+            np.ndarray: Float32 embedding matrix, one row per input
+        """
+        import torch
+
+        if isinstance(sentences, str):
+            sentences = [sentences]
+
+        batch = self._tokenizer(
+            list(sentences), padding=True, truncation=True, return_tensors='pt'
+        )
+        with torch.no_grad():
+            hidden = self._model(**batch).last_hidden_state
+
+        # Mean pooling over real tokens, then L2 normalization — the same
+        # head all-MiniLM-L6-v2 applies
+        mask = batch['attention_mask'].unsqueeze(-1).to(hidden.dtype)
+        pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        pooled = torch.nn.functional.normalize(pooled, p=2, dim=1)
+        return pooled.numpy().astype(np.float32)
+
+def _try_onnx_embedding_model(model_name: str) -> Optional['_OnnxEmbeddingModel']:
+    """
+    Build the ONNX embedding path, or None when the stack is unavailable.
+
+    Args:
+        model_name (str): SentenceTransformer model name (e.g. 'all-MiniLM-L6-v2')
+
+    Returns:
+        Optional[_OnnxEmbeddingModel]: Ready model, or None to fall back
+    """
+    try:
+        model = _OnnxEmbeddingModel(model_name)
+        print("Using ONNX Runtime embedding backend")
+        return model
+    except Exception:
+        return None
+
+def _detect_embedding_device() -> Optional[str]:
+    """
+    Pick the fastest available device for the embedding model.
+
+    Returns:
+        Optional[str]: 'cuda' or 'mps' when available, otherwise None to
+                      let SentenceTransformer default to CPU
+    """
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return 'cuda'
+        if getattr(torch.backends, 'mps', None) is not None and torch.backends.mps.is_available():
+            return 'mps'
+    except ImportError:
+        pass
+    return None
+
+def get_chroma_client() -> chromadb.ClientAPI:
+    """
+    Get or create the shared ChromaDB client for this process.
+
+    The client is persistent (backed by CHROMA_PERSIST_PATH), so collections
+    populated in one run are reused on the next — startup skips JSON
+    re-embedding entirely once the store is warm. Falls back to an
+    in-memory client when the cache directory is not writable.
+
+    Returns:
+        chromadb.ClientAPI: Shared client instance
+
+    Example:
+        >>> client = get_chroma_client()
+        >>> client.list_collections()
+        [...]
+    """
+    global _chroma_client
+    if _chroma_client is None:
+        try:
+            _chroma_client = chromadb.PersistentClient(path=CHROMA_PERSIST_PATH)
+        except Exception as e:
+            print(f"⚠️  Persistent ChromaDB store unavailable ({e}), using in-memory client")
+            _chroma_client = chromadb.Client()
+    return _chroma_client
+
 def load_food_data(file_path: str) -> List[Dict[str, Any]]:
     """
     Load and validate food dataset from JSON file.
@@ -91,33 +294,69 @@ def load_food_data(file_path: str) -> List[Dict[str, Any]]:
         - Missing optional fields are filled with default values
         - Large datasets (>1000 items) may take several seconds to load
         - File encoding is assumed to be UTF-8
+        - Repeat loads of an unchanged file are served from a per-process
+          cache; treat the returned list as read-only
+        - Parsing uses orjson when installed, falling back to stdlib json
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Food dataset file not found: {file_path}")
-    
+
+    # Serve repeat loads of an unchanged file from the per-process cache
+    cache_key = os.path.abspath(file_path)
+    mtime = os.path.getmtime(file_path)
+    cached = _food_data_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-    except json.JSONDecodeError as e:
+        with open(file_path, 'rb') as file:
+            raw = file.read()
+        # Both parsers accept the raw bytes directly — no intermediate
+        # decoded-string copy of the whole file
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (json.JSONDecodeError, ValueError) as e:
         raise ValueError(f"Invalid JSON in dataset file: {e}")
     except PermissionError:
         raise PermissionError(f"Cannot read file due to permissions: {file_path}")
     
     if not isinstance(data, list):
         raise ValueError("Dataset must be a JSON array of food items")
+
+    # Validate and clean data: vectorized pandas column ops when available,
+    # otherwise the per-item Python loop
+    try:
+        validated_items = _validate_food_items_vectorized(data)
+    except ImportError:
+        validated_items = _validate_food_items(data)
+
+    if len(validated_items) == 0:
+        raise ValueError("No valid food items found in dataset")
     
-    # Validate and clean data
+    print(f"Successfully loaded {len(validated_items)} food items from {file_path}")
+    _food_data_cache[cache_key] = (mtime, validated_items)
+    return validated_items
+
+def _validate_food_items(data: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Clean and validate raw dataset entries with a per-item Python loop.
+
+    Args:
+        data (List[Any]): Parsed JSON array of raw food entries
+
+    Returns:
+        List[Dict[str, Any]]: Cleaned food item dictionaries
+    """
     validated_items = []
     required_fields = ['food_name', 'cuisine_type', 'food_description']
-    
-    for i, item in enumerate(data):
+
+    for item in data:
         if not isinstance(item, dict):
             continue  # Skip invalid items
-        
+
         # Check required fields
         if not all(field in item and item[field] for field in required_fields):
             continue  # Skip items missing required fields
-        
+
         # Clean and standardize data
         cleaned_item = {
             'food_name': str(item['food_name']).strip(),
@@ -130,37 +369,95 @@ def load_food_data(file_path: str) -> List[Dict[str, Any]]:
             'taste_profile': str(item.get('taste_profile', ''))
         }
         validated_items.append(cleaned_item)
-    
-    if len(validated_items) == 0:
-        raise ValueError("No valid food items found in dataset")
-    
-    print(f"Successfully loaded {len(validated_items)} food items from {file_path}")
+
     return validated_items
 
-def create_similarity_search_collection(name: str, metadata: Optional[Dict] = None) -> chromadb.Collection:
+def _validate_food_items_vectorized(data: List[Any]) -> List[Dict[str, Any]]:
     """
-    Create a ChromaDB collection for similarity search.
-    
-    This function initializes a new ChromaDB collection that will be used
+    Clean and validate raw dataset entries with vectorized pandas column ops.
+
+    Each cleaning rule (required-field presence, string stripping, calorie
+    coercion) runs once over a whole column instead of once per item, which
+    scales much better than the Python loop on large datasets.
+
+    Args:
+        data (List[Any]): Parsed JSON array of raw food entries
+
+    Returns:
+        List[Dict[str, Any]]: Cleaned food item dictionaries, matching the
+                             structure produced by _validate_food_items()
+
+    Raises:
+        ImportError: If pandas is not installed (caller falls back to the loop)
+    """
+    import pandas as pd
+
+    records = [item for item in data if isinstance(item, dict)]
+    if not records:
+        return []
+
+    df = pd.DataFrame(records)
+    required_fields = ['food_name', 'cuisine_type', 'food_description']
+    if any(field not in df.columns for field in required_fields):
+        return []
+
+    # Keep rows where every required field is present and non-empty
+    keep = pd.Series(True, index=df.index)
+    for field in required_fields:
+        keep &= df[field].notna() & (df[field].astype(str).str.strip() != '')
+    df = df[keep]
+    if df.empty:
+        return []
+
+    def column(name: str, default: Any) -> 'pd.Series':
+        if name in df.columns:
+            return df[name]
+        return pd.Series([default] * len(df), index=df.index)
+
+    cleaned = pd.DataFrame({
+        'food_name': df['food_name'].astype(str).str.strip(),
+        'cuisine_type': df['cuisine_type'].astype(str).str.strip(),
+        'food_description': df['food_description'].astype(str).str.strip(),
+        'food_calories_per_serving': pd.to_numeric(
+            column('food_calories_per_serving', 0), errors='coerce'
+        ).fillna(0).astype(int),
+        'food_ingredients': column('food_ingredients', None).map(
+            lambda value: value if isinstance(value, (list, str)) else []
+        ),
+        'food_health_benefits': column('food_health_benefits', '').fillna('').astype(str),
+        'cooking_method': column('cooking_method', '').fillna('').astype(str),
+        'taste_profile': column('taste_profile', '').fillna('').astype(str)
+    })
+    return cleaned.to_dict('records')
+
+def create_similarity_search_collection(name: str, metadata: Optional[Dict] = None,
+                                        reset: bool = False) -> chromadb.Collection:
+    """
+    Create or reuse a ChromaDB collection for similarity search.
+
+    This function initializes a ChromaDB collection that will be used
     to store food item embeddings and perform vector-based similarity searches.
-    If a collection with the same name already exists, it will be deleted first.
-    
+    An existing collection with the same name is reused so that warm startups
+    can skip repopulation; pass reset=True to force a fresh collection.
+
     Args:
         name (str): Unique name for the collection. Should be descriptive
                    and follow naming conventions (e.g., 'food_recommendations').
         metadata (Dict, optional): Additional metadata to associate with
                                  the collection. Useful for versioning,
                                  descriptions, and configuration settings.
-    
+        reset (bool): Delete any existing collection with this name before
+                     creating a new one. Default False (reuse existing data).
+
     Returns:
         chromadb.Collection: ChromaDB collection object that can be used
                            for adding documents and performing searches.
-    
+
     Raises:
         ValueError: If collection name is invalid (empty or None)
         chromadb.errors.ChromaError: If ChromaDB client initialization fails
         ConnectionError: If ChromaDB service is not accessible
-    
+
     Example:
         >>> collection = create_similarity_search_collection(
         ...     "food_search",
@@ -168,35 +465,44 @@ def create_similarity_search_collection(name: str, metadata: Optional[Dict] = No
         ... )
         >>> print(f"Created collection: {collection.name}")
         Created collection: food_search
-    
+
     Note:
         - Collection names must be unique within a ChromaDB instance
-        - If a collection with the same name exists, it will be deleted first
+        - Reusing an existing collection lets populate_similarity_collection()
+          skip the embedding pass entirely on warm startup
         - Metadata is stored with the collection and can be retrieved later
         - The collection uses cosine similarity by default for vector comparisons
     """
     if not name or not isinstance(name, str):
         raise ValueError("Collection name must be a non-empty string")
-    
+
     try:
-        client = chromadb.Client()
-        
-        # Delete existing collection if it exists
-        try:
-            client.delete_collection(name=name)
-            print(f"Deleted existing collection: {name}")
-        except ValueError:
-            pass  # Collection doesn't exist, which is fine
-        
-        # Create new collection
-        collection = client.create_collection(
+        client = get_chroma_client()
+
+        if reset:
+            # Delete existing collection if it exists
+            try:
+                client.delete_collection(name=name)
+                print(f"Deleted existing collection: {name}")
+            except ValueError:
+                pass  # Collection doesn't exist, which is fine
+
+            # Cached search results and the flat store reference the old
+            # collection contents
+            _cached_query.cache_clear()
+            _search_collections.pop(name, None)
+            _flat_stores.pop(name, None)
+
+        # Create new collection, or pick up the existing one on warm startup.
+        # Explicit HNSW settings override Chroma's generic defaults.
+        collection = client.get_or_create_collection(
             name=name,
-            metadata=metadata or {}
+            metadata={**HNSW_INDEX_SETTINGS, **(metadata or {})}
         )
-        
-        print(f"Created new collection: {name}")
+
+        print(f"Using collection: {name} ({collection.count()} items)")
         return collection
-        
+
     except Exception as e:
         raise ConnectionError(f"Failed to create ChromaDB collection: {e}")
 
@@ -236,75 +542,112 @@ def populate_similarity_collection(collection: chromadb.Collection, food_items:
     
     if not food_items or len(food_items) == 0:
         raise ValueError("food_items cannot be empty")
-    
+
+    # Register SoA columns for vectorized filter prechecks (needed for both
+    # warm and cold starts)
+    _food_columns[collection.name] = build_food_columns(food_items)
+
+    # Warm startup: the collection already holds this dataset, so skip the
+    # embedding pass entirely. The flat in-memory index still has to be
+    # rebuilt from the persisted embeddings, otherwise every warm run would
+    # silently fall back to the Chroma round-trip.
+    if collection.count() == len(food_items):
+        print(f"Collection already contains {len(food_items)} items, skipping population")
+        if collection.name not in _flat_stores and len(food_items) <= FLAT_SEARCH_MAX_ITEMS:
+            try:
+                stored = collection.get(include=['embeddings', 'metadatas'])
+                if stored['embeddings'] is not None and len(stored['embeddings']) > 0:
+                    _flat_stores[collection.name] = FlatVectorIndex(
+                        np.asarray(stored['embeddings'], dtype=np.float32),
+                        stored['ids'], stored['metadatas']
+                    )
+            except Exception:
+                pass  # Flat index is an optimization; the Chroma path still works
+        return
+
     print(f"Generating embeddings for {len(food_items)} food items...")
     
     try:
         # Get embedding model
         embedder = get_embedding_model()
         
-        # Prepare data for ChromaDB
-        documents = []
-        metadatas = []
-        ids = []
-        
-        for i, item in enumerate(food_items):
-            # Create searchable text by combining relevant fields
-            searchable_parts = [
-                item['food_name'],
-                item['cuisine_type'], 
-                item['food_description']
-            ]
-            
-            # Add optional fields if available
-            if item.get('food_ingredients'):
-                if isinstance(item['food_ingredients'], list):
-                    searchable_parts.append(' '.join(item['food_ingredients']))
-                else:
-                    searchable_parts.append(str(item['food_ingredients']))
-            
-            if item.get('taste_profile'):
-                searchable_parts.append(item['taste_profile'])
-            
-            if item.get('cooking_method'):
-                searchable_parts.append(item['cooking_method'])
-            
-            # Create final searchable document
-            searchable_text = ' '.join(searchable_parts)
-            documents.append(searchable_text)
-            
-            # Prepare metadata (ChromaDB requires string values)
-            metadata = {
-                'food_name': item['food_name'],
-                'cuisine_type': item['cuisine_type'],
-                'calories': str(item['food_calories_per_serving']),
-                'ingredients': str(item.get('food_ingredients', [])),
-                'health_benefits': item.get('food_health_benefits', ''),
-                'cooking_method': item.get('cooking_method', ''),
-                'taste_profile': item.get('taste_profile', ''),
-                'description': item['food_description']
-            }
-            metadatas.append(metadata)
-            ids.append(f"food_{i}")
+        # Prepare data for ChromaDB column by column (SoA layout): each
+        # array is built in its own tight pass rather than interleaving
+        # three appends per item
+        documents = [_build_searchable_text(item) for item in food_items]
+
+        # Prepare metadata (ChromaDB accepts scalar values; calories stay
+        # int so result formatting never re-parses them per query)
+        metadatas = [{
+            'food_name': item['food_name'],
+            'cuisine_type': item['cuisine_type'],
+            'calories': item['food_calories_per_serving'],
+            'ingredients': str(item.get('food_ingredients', [])),
+            'health_benefits': item.get('food_health_benefits', ''),
+            'cooking_method': item.get('cooking_method', ''),
+            'taste_profile': item.get('taste_profile', ''),
+            'description': item['food_description']
+        } for item in food_items]
+
+        ids = [f"food_{i}" for i in range(len(food_items))]
         
-        # Generate embeddings
+        # Generate embeddings, unit-norm so the 'ip' index space scores
+        # them without re-normalizing per query
         print("Generating embeddings...")
-        embeddings = embedder.encode(documents, show_progress_bar=True)
+        embeddings = embedder.encode(documents, show_progress_bar=True,
+                                     normalize_embeddings=True)
         
-        # Add to collection
+        # Add to collection in batched calls (one call for typical dataset
+        # sizes; chunked to stay under ChromaDB's per-request batch limit)
         print("Adding items to ChromaDB collection...")
-        collection.add(
-            documents=documents,
-            metadatas=metadatas,
-            embeddings=embeddings.tolist(),
-            ids=ids
-        )
-        
+        # Hand Chroma the float32 array directly — no Python-list round-trip
+        embedding_rows = np.asarray(embeddings, dtype=np.float32)
+        for start in range(0, len(ids), ADD_BATCH_SIZE):
+            end = start + ADD_BATCH_SIZE
+            collection.add(
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+                embeddings=embedding_rows[start:end],
+                ids=ids[start:end]
+            )
+
+        # Small corpora also get a flat in-memory index: one exact scoring
+        # pass over a contiguous matrix is faster than the HNSW round-trip
+        if len(food_items) <= FLAT_SEARCH_MAX_ITEMS:
+            _flat_stores[collection.name] = FlatVectorIndex(embeddings, ids, metadatas)
+
+        # The collection contents changed, so memoized result lists are stale
+        _cached_query.cache_clear()
+
         print(f"Added {len(food_items)} food items to collection")
         
     except Exception as e:
         raise RuntimeError(f"Failed to populate collection: {e}")
 
+def _build_searchable_text(item: Dict[str, Any]) -> str:
+    """
+    Combine a food item's text fields into one searchable document.
+
+    Required fields come first, optional fields are appended when present,
+    and the whole document is assembled with a single str.join pass.
+
+    Args:
+        item (Dict[str, Any]): Validated food item from load_food_data()
+
+    Returns:
+        str: Space-joined searchable text for embedding
+    """
+    ingredients = item.get('food_ingredients')
+    parts = [
+        item['food_name'],
+        item['cuisine_type'],
+        item['food_description'],
+        ' '.join(ingredients) if isinstance(ingredients, list) else str(ingredients or ''),
+        item.get('taste_profile', ''),
+        item.get('cooking_method', '')
+    ]
+    return ' '.join(part for part in parts if part)
+
 def perform_similarity_search(collection: chromadb.Collection, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
     """
     Perform similarity search on a ChromaDB collection.
@@ -353,50 +696,446 @@ def perform_similarity_search(collection: chromadb.Collection, query: str, n_res
         return []
     
     query = query.strip()
-    
+
     try:
-        # Get embedding model and generate query embedding
-        embedder = get_embedding_model()
-        query_embedding = embedder.encode([query])
-        
-        # Perform search
-        results = collection.query(
-            query_embeddings=query_embedding.tolist(),
-            n_results=min(n_results, 100)  # Cap at reasonable limit
-        )
-        
-        # Format results
-        formatted_results = []
-        
-        if results['ids'] and len(results['ids'][0]) > 0:
-            for i in range(len(results['ids'][0])):
-                metadata = results['metadatas'][0][i]
-                distance = results['distances'][0][i]
-                
-                # Convert distance to similarity score (ChromaDB uses cosine distance)
-                similarity_score = max(0.0, 1.0 - distance)
-                
-                result = {
-                    'food_name': metadata['food_name'],
-                    'cuisine_type': metadata['cuisine_type'],
-                    'food_description': metadata['description'],
-                    'food_calories_per_serving': int(metadata['calories']) if metadata['calories'].isdigit() else 0,
-                    'similarity_score': similarity_score,
-                    'food_ingredients': metadata.get('ingredients', ''),
-                    'food_health_benefits': metadata.get('health_benefits', ''),
-                    'cooking_method': metadata.get('cooking_method', ''),
-                    'taste_profile': metadata.get('taste_profile', '')
-                }
-                formatted_results.append(result)
-        
-        # Sort by similarity score (highest first)
-        formatted_results.sort(key=lambda x: x['similarity_score'], reverse=True)
-        
-        return formatted_results
-        
+        # Delegate to the memoized search path (repeat queries are cache hits)
+        _search_collections[collection.name] = collection
+        return list(_cached_query(collection.name, _normalize_query_key(query),
+                                  None, None, min(n_results, 100)))
+
     except Exception as e:
         raise RuntimeError(f"Similarity search failed: {e}")
 
+def perform_similarity_search_async(collection: chromadb.Collection, query: str,
+                                    n_results: int = 5) -> Future:
+    """
+    Run perform_similarity_search on a worker thread.
+
+    Callers can kick off a search and keep rendering output (or reading
+    user input) while it runs; the GIL is released inside ChromaDB's C++
+    search and the torch encode, so the overlap is real parallelism.
+
+    Args:
+        collection (chromadb.Collection): ChromaDB collection to search
+        query (str): Natural language search query
+        n_results (int): Maximum number of results to return (default: 5)
+
+    Returns:
+        Future: Resolves to the same result list perform_similarity_search
+                returns; exceptions surface on .result()
+
+    Example:
+        >>> future = perform_similarity_search_async(collection, "spicy chicken", 10)
+        >>> print("Searching...")  # overlaps with the search
+        >>> results = future.result()
+    """
+    return _query_pool.submit(perform_similarity_search, collection, query, n_results)
+
+def build_food_columns(food_items: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Convert a food item list into structure-of-arrays NumPy columns.
+
+    The list-of-dicts layout scatters each field across the heap; pulling
+    calories and cuisines into contiguous typed arrays lets filter checks
+    run as vectorized comparisons over the whole catalog at once.
+
+    Args:
+        food_items (List[Dict[str, Any]]): Validated items from load_food_data()
+
+    Returns:
+        Dict[str, np.ndarray]: Columns keyed by field:
+            - 'calories' (int32): Calories per serving
+            - 'cuisine_lower' (str): Lowercased cuisine types for
+              case-insensitive matching
+
+    Example:
+        >>> columns = build_food_columns(food_items)
+        >>> int((columns['calories'] <= 300).sum())
+        42
+    """
+    return {
+        'calories': np.array([item['food_calories_per_serving'] for item in food_items],
+                             dtype=np.int32),
+        'cuisine_lower': np.array([item['cuisine_type'].lower() for item in food_items])
+    }
+
+def _count_filter_matches(columns: Dict[str, np.ndarray], cuisine_filter: Optional[str] = None,
+                          max_calories: Optional[int] = None) -> int:
+    """
+    Count catalog items satisfying the given filters via vectorized masks.
+
+    Args:
+        columns (Dict[str, np.ndarray]): Columns from build_food_columns()
+        cuisine_filter (str, optional): Cuisine type to match (case-insensitive)
+        max_calories (int, optional): Maximum allowed calories per serving
+
+    Returns:
+        int: Number of items passing all provided filters
+    """
+    mask = np.ones(len(columns['calories']), dtype=bool)
+    if cuisine_filter:
+        mask &= columns['cuisine_lower'] == cuisine_filter.lower()
+    if max_calories is not None:
+        mask &= columns['calories'] <= max_calories
+    return int(mask.sum())
+
+def _embed_queries_cached(queries: List[str]) -> List[List[float]]:
+    """
+    Embed query strings, serving repeats from the LRU embedding cache.
+
+    Cache misses are collected and encoded in a single batched model call,
+    so a mixed batch pays one forward pass for the new queries only.
+
+    Args:
+        queries (List[str]): Cleaned, non-empty query strings
+
+    Returns:
+        List[List[float]]: One embedding vector per query, in input order
+    """
+    misses = [q for q in queries if q not in _query_embedding_cache]
+    if misses:
+        # Unit-norm to match the stored vectors in the 'ip' index space
+        encoded = get_embedding_model().encode(misses, normalize_embeddings=True)
+        for query, vector in zip(misses, encoded):
+            _query_embedding_cache[query] = np.asarray(vector, dtype=np.float32)
+
+    embeddings = []
+    for query in queries:
+        _query_embedding_cache.move_to_end(query)
+        embeddings.append(_query_embedding_cache[query])
+
+    while len(_query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+        _query_embedding_cache.popitem(last=False)
+
+    return embeddings
+
+@dataclass(slots=True)
+class SearchHit:
+    """
+    A single similarity search result.
+
+    Slotted instances skip the per-result __dict__ (and its hashing/resize
+    overhead), which matters when every query formats dozens of rows.
+    Subscript access (hit['food_name']) and .get() are provided so existing
+    dict-style consumers keep working unchanged.
+
+    Attributes:
+        food_name: Name of the food item
+        cuisine_type: Type of cuisine
+        food_description: Description of the food
+        food_calories_per_serving: Calories per serving
+        similarity_score: Similarity score (0.0 to 1.0, higher is better)
+        food_ingredients: Ingredient list as stored in metadata
+        food_health_benefits: Health benefits description
+        cooking_method: Method of preparation
+        taste_profile: Flavor characteristics
+    """
+    food_name: str
+    cuisine_type: str
+    food_description: str
+    food_calories_per_serving: int
+    similarity_score: float
+    food_ingredients: str = ''
+    food_health_benefits: str = ''
+    cooking_method: str = ''
+    taste_profile: str = ''
+
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style field access for existing consumers."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style .get() with a default for missing fields."""
+        return getattr(self, key, default)
+
+def _format_result_row(metadata: Dict[str, Any], similarity_score: float) -> SearchHit:
+    """
+    Convert a single metadata/score pair into a SearchHit.
+
+    Args:
+        metadata (Dict[str, Any]): Metadata stored with the matched item
+        similarity_score (float): Similarity score (0.0 to 1.0)
+
+    Returns:
+        SearchHit: Formatted result supporting dict-style access
+    """
+    # Calories are stored as int at populate time; the str branch only
+    # covers collections persisted before that change
+    calories = metadata['calories']
+    if not isinstance(calories, int):
+        calories = int(calories) if str(calories).isdigit() else 0
+    return SearchHit(
+        food_name=metadata['food_name'],
+        cuisine_type=metadata['cuisine_type'],
+        food_description=metadata['description'],
+        food_calories_per_serving=calories,
+        similarity_score=similarity_score,
+        food_ingredients=metadata.get('ingredients', ''),
+        food_health_benefits=metadata.get('health_benefits', ''),
+        cooking_method=metadata.get('cooking_method', ''),
+        taste_profile=metadata.get('taste_profile', '')
+    )
+
+def _result_matches_filters(result: Dict[str, Any], cuisine_filter: Optional[str] = None,
+                            max_calories: Optional[int] = None) -> bool:
+    """
+    Check whether a formatted result satisfies the given metadata filters.
+
+    Args:
+        result (Dict[str, Any]): Formatted result from _format_result_row()
+        cuisine_filter (str, optional): Cuisine type the result must match (case-insensitive)
+        max_calories (int, optional): Maximum allowed calories per serving
+
+    Returns:
+        bool: True if the result passes all provided filters
+    """
+    if cuisine_filter and result['cuisine_type'].lower() != cuisine_filter.lower():
+        return False
+    if max_calories is not None and result['food_calories_per_serving'] > max_calories:
+        return False
+    return True
+
+def perform_similarity_search_batch(collection: chromadb.Collection, queries: List[str],
+                                    n_results: int = 5,
+                                    filters: Optional[List[Dict[str, Any]]] = None,
+                                    query_embeddings: Optional[List[List[float]]] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Perform several similarity searches with a single ChromaDB query.
+
+    ChromaDB accepts multiple query embeddings in one call, so batching N
+    queries costs one embedding pass and one index traversal instead of N.
+    Use this whenever multiple queries are known up front (demonstrations,
+    comparisons) rather than issuing sequential perform_similarity_search()
+    calls.
+
+    Args:
+        collection (chromadb.Collection): ChromaDB collection to search
+        queries (List[str]): Natural language search queries
+        n_results (int): Maximum number of results to return per query (default: 5)
+        filters (List[Dict], optional): Per-query filter dictionaries, aligned
+                                       with queries. Each may contain
+                                       'cuisine_filter' (str) and/or
+                                       'max_calories' (int). Use None entries
+                                       (or omit the list) for unfiltered queries.
+        query_embeddings (List[List[float]], optional): Precomputed embedding
+                                       vectors aligned with queries. When
+                                       provided, the embedding pass is skipped
+                                       entirely (useful for persisted caches).
+
+    Returns:
+        List[List[Dict[str, Any]]]: One result list per query, in input order.
+                                   Each result has the same structure as
+                                   perform_similarity_search() results.
+
+    Raises:
+        ValueError: If collection is None or filters length mismatches queries
+        RuntimeError: If the search operation fails
+
+    Example:
+        >>> batched = perform_similarity_search_batch(
+        ...     collection,
+        ...     ["creamy pasta", "healthy meal"],
+        ...     n_results=3,
+        ...     filters=[{'cuisine_filter': 'Italian'}, {'max_calories': 300}]
+        ... )
+        >>> print(len(batched))
+        2
+
+    Note:
+        - Filtered queries over-fetch internally to compensate for filter
+          rejections, then trim back to n_results
+        - Empty or whitespace-only queries return an empty result list
+    """
+    if collection is None:
+        raise ValueError("Collection cannot be None")
+
+    if filters is not None and len(filters) != len(queries):
+        raise ValueError("filters must align with queries (same length)")
+
+    if query_embeddings is not None and len(query_embeddings) != len(queries):
+        raise ValueError("query_embeddings must align with queries (same length)")
+
+    cleaned_queries = [q.strip() if isinstance(q, str) else '' for q in queries]
+    active = [(i, q) for i, q in enumerate(cleaned_queries) if q]
+
+    batched_results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+    if not active:
+        return batched_results
+
+    has_filters = any(f for f in (filters or []))
+    # Over-fetch when filtering so post-filter lists still reach n_results
+    fetch_n = min(n_results * 3 if has_filters else n_results, 100)
+
+    # Vectorized precheck against the SoA columns: drop queries whose filters
+    # cannot match anything, and size the over-fetch by the worst selectivity
+    columns = _food_columns.get(collection.name) if has_filters else None
+    if columns is not None:
+        catalog_size = len(columns['calories'])
+        selectivities = []
+        possible = []
+        for query_index, query in active:
+            query_filter = (filters[query_index] or {}) if filters else {}
+            matches = _count_filter_matches(
+                columns,
+                query_filter.get('cuisine_filter'),
+                query_filter.get('max_calories')
+            )
+            if matches == 0:
+                continue  # No item can satisfy this filter; skip the query
+            selectivities.append(matches / catalog_size)
+            possible.append((query_index, query))
+        active = possible
+        if not active:
+            return batched_results
+        worst_selectivity = min(selectivities)
+        fetch_n = min(max(n_results, int(np.ceil(n_results / worst_selectivity))), 100)
+
+    try:
+        if query_embeddings is not None:
+            embedding_matrix = np.asarray([query_embeddings[i] for i, _ in active],
+                                          dtype=np.float32)
+        else:
+            # One embedding pass for all uncached queries; stack the cached
+            # float32 vectors without converting through Python lists
+            embedding_matrix = np.stack(_embed_queries_cached([q for _, q in active]))
+
+        # One traversal for all queries: the exact flat index when the corpus
+        # is small enough to live in memory, otherwise the Chroma index
+        store = _flat_stores.get(collection.name)
+        if store is not None:
+            results = store.query(embedding_matrix, fetch_n)
+        else:
+            results = collection.query(
+                query_embeddings=embedding_matrix,
+                n_results=fetch_n
+            )
+
+        for pos, (query_index, _) in enumerate(active):
+            query_filter = (filters[query_index] or {}) if filters else {}
+            cuisine_filter = query_filter.get('cuisine_filter')
+            max_calories = query_filter.get('max_calories')
+
+            formatted_results = []
+            if results['ids'] and len(results['ids'][pos]) > 0:
+                # Vectorized distance-to-score conversion for the whole row
+                scores_row = np.maximum(
+                    0.0, 1.0 - np.asarray(results['distances'][pos], dtype=np.float32)
+                )
+                for i in range(len(results['ids'][pos])):
+                    result = _format_result_row(
+                        results['metadatas'][pos][i],
+                        float(scores_row[i])
+                    )
+                    if _result_matches_filters(result, cuisine_filter, max_calories):
+                        formatted_results.append(result)
+
+            # Both backends return rows ranked best-first (distance
+            # ascending), so trimming preserves score order without a re-sort
+            batched_results[query_index] = formatted_results[:n_results]
+
+        return batched_results
+
+    except Exception as e:
+        raise RuntimeError(f"Batched similarity search failed: {e}")
+
+def _normalize_query_key(query: str) -> str:
+    """
+    Normalize a query for result-cache keying.
+
+    Casing and whitespace variants of the same phrase ('Spicy  Chicken',
+    'spicy chicken') rank identically, so folding them into one key lets
+    retyped queries hit the cache instead of re-embedding.
+
+    Args:
+        query (str): Raw user query
+
+    Returns:
+        str: Lowercased query with collapsed whitespace
+    """
+    return ' '.join(query.lower().split())
+
+@lru_cache(maxsize=512)
+def _cached_query(collection_name: str, query: str, cuisine_filter: Optional[str],
+                  max_calories: Optional[int], n_results: int) -> tuple:
+    """
+    Execute a similarity search and memoize the result list.
+
+    Interactive loops frequently repeat the same query (retries, demo runs,
+    back-to-back budget checks), and every uncached call re-embeds the text
+    and traverses the index. Caching on (query, filters, n_results) turns
+    repeat lookups into dictionary hits.
+
+    Args:
+        collection_name (str): Name of a collection registered in _search_collections
+        query (str): Normalized, non-empty search query (see
+                     _normalize_query_key())
+        cuisine_filter (str, optional): Cuisine filter, or None
+        max_calories (int, optional): Calorie ceiling, or None
+        n_results (int): Maximum number of results
+
+    Returns:
+        tuple: Immutable tuple of result dictionaries (hashable-friendly for
+               cache storage; callers convert back to a list)
+
+    Note:
+        - The cache is cleared whenever a collection is rebuilt or newly
+          populated, since cached results would be stale
+    """
+    collection = _search_collections[collection_name]
+    results = perform_similarity_search_batch(
+        collection, [query], n_results,
+        [{'cuisine_filter': cuisine_filter, 'max_calories': max_calories}]
+    )[0]
+    return tuple(results)
+
+def perform_filtered_similarity_search(collection: chromadb.Collection, query: str,
+                                       cuisine_filter: Optional[str] = None,
+                                       max_calories: Optional[int] = None,
+                                       n_results: int = 5) -> List[Dict[str, Any]]:
+    """
+    Perform similarity search with optional cuisine and calorie filters.
+
+    This function works like perform_similarity_search() but restricts the
+    results to a specific cuisine type and/or a maximum calorie budget.
+    Filtering is applied after retrieval, with over-fetching to keep the
+    filtered list close to n_results.
+
+    Args:
+        collection (chromadb.Collection): ChromaDB collection to search
+        query (str): Natural language search query
+        cuisine_filter (str, optional): Restrict results to this cuisine type
+        max_calories (int, optional): Exclude results above this calorie count
+        n_results (int): Maximum number of results to return (default: 5)
+
+    Returns:
+        List[Dict[str, Any]]: Filtered results with the same structure as
+                             perform_similarity_search() results
+
+    Raises:
+        ValueError: If collection is None
+        RuntimeError: If the search operation fails
+
+    Example:
+        >>> results = perform_filtered_similarity_search(
+        ...     collection, "creamy pasta", cuisine_filter="Italian", n_results=3
+        ... )
+        >>> all(r['cuisine_type'] == 'Italian' for r in results)
+        True
+    """
+    if collection is None:
+        raise ValueError("Collection cannot be None")
+
+    if not query or not isinstance(query, str) or query.strip() == "":
+        return []
+
+    # Delegate to the memoized search path (repeat queries are cache hits)
+    _search_collections[collection.name] = collection
+    return list(_cached_query(collection.name, _normalize_query_key(query),
+                              cuisine_filter, max_calories, n_results))
+
 def validate_collection_health(collection: chromadb.Collection) -> Dict[str, Any]:
     """
     Validate the health and status of a ChromaDB collection.
@@ -8,10 +8,42 @@ Author: Food Recommendation Team
 Version: 1.0.0
 """
 
-from typing import Dict, List, Any, Union, Optional, Protocol, TypedDict, Literal, Callable
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Deque, Dict, List, Any, Mapping, Union, Optional, Protocol, TypedDict, Literal, Callable, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+import numpy.typing as npt
+
+try:
+    import msgspec  # Optional: C-level schema validation, far faster than dict probing
+except ImportError:
+    msgspec = None
+
+try:
+    from numba import njit, prange  # Optional: JIT-compiled scoring kernel
+except ImportError:
+    njit = None
+
+try:
+    from pybloom_live import BloomFilter  # Optional: O(1) duplicate probes at fixed memory
+except ImportError:
+    BloomFilter = None
+
+try:
+    import orjson  # Optional: C-backed JSON parser, several times faster than stdlib
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # Core Data Types
 # =============================================================================
@@ -69,6 +101,29 @@ class CuisineType(Enum):
     HEALTH = "Health"
     MODERN = "Modern"
 
+# Prebuilt value -> enum lookups. CuisineType("Italian") walks the members
+# O(n) and raises on a miss; a dict hit is O(1) and the case-insensitive
+# table catches JSON casing variants without a second pass.
+_CUISINE_BY_VALUE: Dict[str, CuisineType] = {c.value: c for c in CuisineType}
+_CUISINE_BY_VALUE_CI: Dict[str, CuisineType] = {c.value.lower(): c for c in CuisineType}
+
+def cuisine_from_str(value: str,
+                     default: CuisineType = CuisineType.FUSION) -> CuisineType:
+    """
+    Resolve a cuisine string to its enum member.
+
+    Args:
+        value: Cuisine name, e.g. "Italian" (any casing)
+        default: Member returned when the value is unknown
+
+    Returns:
+        The matching CuisineType, or the default on a miss
+    """
+    member = _CUISINE_BY_VALUE.get(value)
+    if member is not None:
+        return member
+    return _CUISINE_BY_VALUE_CI.get(value.lower(), default)
+
 class LogLevel(Enum):
     """Logging levels for the application."""
     DEBUG = "DEBUG"
@@ -77,15 +132,23 @@ class LogLevel(Enum):
     ERROR = "ERROR"
     CRITICAL = "CRITICAL"
 
+# Interned cuisine value strings: serialization reuses one shared string
+# object per cuisine instead of re-reading the enum .value descriptor.
+_CUISINE_STR: Dict[CuisineType, str] = {c: sys.intern(c.value) for c in CuisineType}
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FoodItem:
     """
     Structured representation of a food item.
-    
+
+    Slotted instances avoid the per-object __dict__, which matters when the
+    whole catalog is materialized at once.
+
+
     Attributes:
         name: Name of the food item
         cuisine: Type of cuisine
@@ -104,25 +167,56 @@ class FoodItem:
     health_benefits: str = ""
     cooking_method: str = ""
     taste_profile: str = ""
-    
+    _dict_cache: Optional[FoodItemDict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _template_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def search_template(self) -> Dict[str, Any]:
+        """
+        Precomputed serialization fields for search results over this item.
+
+        Built once per item with the ingredients pre-joined; every
+        SearchResult.to_dict() then spreads this template instead of
+        copying eight attributes per call.
+        """
+        if self._template_cache is None:
+            self._template_cache = {
+                'food_name': self.name,
+                'cuisine_type': _CUISINE_STR[self.cuisine],
+                'food_description': self.description,
+                'food_calories_per_serving': self.calories,
+                'food_ingredients': ", ".join(self.ingredients),
+                'food_health_benefits': self.health_benefits,
+                'cooking_method': self.cooking_method,
+                'taste_profile': self.taste_profile
+            }
+        return self._template_cache
+
     def to_dict(self) -> FoodItemDict:
-        """Convert to dictionary format."""
-        return FoodItemDict(
-            food_name=self.name,
-            cuisine_type=self.cuisine.value,
-            food_description=self.description,
-            food_calories_per_serving=self.calories,
-            food_ingredients=self.ingredients,
-            food_health_benefits=self.health_benefits,
-            cooking_method=self.cooking_method,
-            taste_profile=self.taste_profile
-        )
+        """Convert to dictionary format (cached after the first call)."""
+        # Items are never mutated once built, so the dict is computed once
+        if self._dict_cache is None:
+            self._dict_cache = FoodItemDict(
+                food_name=self.name,
+                cuisine_type=_CUISINE_STR[self.cuisine],
+                food_description=self.description,
+                food_calories_per_serving=self.calories,
+                food_ingredients=self.ingredients,
+                food_health_benefits=self.health_benefits,
+                cooking_method=self.cooking_method,
+                taste_profile=self.taste_profile
+            )
+        return self._dict_cache
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """
     Structured representation of a search result.
-    
+
     Attributes:
         food_item: The matched food item
         similarity_score: Relevance score (0.0 to 1.0)
@@ -131,26 +225,322 @@ class SearchResult:
     food_item: FoodItem
     similarity_score: float
     metadata: Dict[str, Any]
-    
+    _dict_cache: Optional[SearchResultDict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> SearchResultDict:
-        """Convert to dictionary format."""
-        return SearchResultDict(
-            food_name=self.food_item.name,
-            cuisine_type=self.food_item.cuisine.value,
-            food_description=self.food_item.description,
-            food_calories_per_serving=self.food_item.calories,
-            similarity_score=self.similarity_score,
-            food_ingredients=", ".join(self.food_item.ingredients),
-            food_health_benefits=self.food_item.health_benefits,
-            cooking_method=self.food_item.cooking_method,
-            taste_profile=self.food_item.taste_profile
-        )
+        """Convert to dictionary format (cached after the first call)."""
+        if self._dict_cache is None:
+            # One C-level dict spread of the item's precomputed template
+            # plus the per-result score
+            self._dict_cache = {
+                **self.food_item.search_template,
+                'similarity_score': self.similarity_score
+            }
+        return self._dict_cache
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _jit_dot_scores(mat, q):
+        """JIT-compiled (items x dim) @ (dim,) dot product, prange over rows."""
+        n_items, dim = mat.shape
+        out = np.empty(n_items, dtype=np.float32)
+        for i in prange(n_items):
+            acc = np.float32(0.0)
+            for k in range(dim):
+                acc += mat[i, k] * q[k]
+            out[i] = acc
+        return out
+else:
+    _jit_dot_scores = None
+
+def cosine_topk(mat: np.ndarray, q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k cosine scores of a query against pre-normalized rows.
+
+    Rows and query are assumed unit-norm, so the dot product is the cosine
+    similarity. The scoring pass runs through the numba kernel when
+    available (LLVM autovectorizes the inner reduction and prange splits
+    rows across cores) and falls back to BLAS otherwise; selection uses
+    argpartition so only k candidates are sorted.
+
+    Args:
+        mat: (N, D) float32 matrix of unit-norm item embeddings
+        q: (D,) float32 unit-norm query embedding
+        k: Number of top rows to return
+
+    Returns:
+        Tuple of (row indices, scores), ranked best-first
+    """
+    mat = np.asarray(mat, dtype=np.float32)
+    q = np.asarray(q, dtype=np.float32)
+    if _jit_dot_scores is not None:
+        scores = _jit_dot_scores(mat, q)
+    else:
+        scores = mat @ q
+    return _select_topk(scores, k)
+
+def _select_topk(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rank the top-k entries of a score vector via argpartition."""
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+    part = np.argpartition(-scores, k - 1)[:k]
+    order = part[np.argsort(-scores[part])]
+    return order, scores[order]
+
+def quantize_int8(mat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize embedding rows to int8 with symmetric per-row scales.
+
+    The static catalog doesn't need float32 precision for ranking: int8
+    rows cut the resident matrix 4x (similarity search is memory-bandwidth
+    bound), and per-row scales use the full [-127, 127] range per vector.
+
+    Args:
+        mat: (N, D) float32 embedding matrix
+
+    Returns:
+        Tuple of (int8 matrix, float32 per-row scales); a row dequantizes
+        as q[i] * scales[i]
+    """
+    mat = np.asarray(mat, dtype=np.float32)
+    scales = (np.maximum(np.abs(mat).max(axis=1), 1e-12) / 127.0).astype(np.float32)
+    quantized = np.clip(np.rint(mat / scales[:, None]), -127, 127).astype(np.int8)
+    return quantized, scales
+
+def int8_topk(quantized: np.ndarray, scales: np.ndarray,
+              q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k scores of a float32 query against an int8-quantized matrix.
+
+    The query is quantized with the same symmetric scheme, the dot runs in
+    int32, and one float rescale at the end recovers the similarity.
+
+    Args:
+        quantized: (N, D) int8 matrix from quantize_int8()
+        scales: (N,) float32 per-row scales from quantize_int8()
+        q: (D,) float32 query embedding
+        k: Number of top rows to return
+
+    Returns:
+        Tuple of (row indices, scores), ranked best-first
+    """
+    q = np.asarray(q, dtype=np.float32)
+    q_scale = np.float32(max(float(np.abs(q).max()), 1e-12) / 127.0)
+    q_int8 = np.clip(np.rint(q / q_scale), -127, 127).astype(np.int8)
+    raw = quantized.astype(np.int32) @ q_int8.astype(np.int32)
+    scores = raw.astype(np.float32) * (scales * q_scale)
+    return _select_topk(scores, k)
+
+class SearchResultPool:
+    """
+    Free-list recycler for SearchResult instances.
+
+    Every search materializes k results that die as soon as the response
+    is serialized; recycling them through a small free list removes the
+    per-request allocator churn. Combined with slots on SearchResult,
+    steady-state searches allocate nothing on the result path.
+
+    Example:
+        >>> pool = SearchResultPool()
+        >>> with pool.lease(item, 0.9, {}) as result:
+        ...     payload = result.to_dict()
+    """
+
+    def __init__(self, size: int = 128):
+        self._stack: List[SearchResult] = [
+            SearchResult.__new__(SearchResult) for _ in range(size)
+        ]
+
+    def acquire(self, food_item: FoodItem, similarity_score: float,
+                metadata: Dict[str, Any]) -> SearchResult:
+        """Take a result from the pool (allocating on underflow) and fill it."""
+        result = self._stack.pop() if self._stack else SearchResult.__new__(SearchResult)
+        result.food_item = food_item
+        result.similarity_score = similarity_score
+        result.metadata = metadata
+        result._dict_cache = None  # A recycled instance may hold a stale dict
+        return result
+
+    def release(self, result: SearchResult) -> None:
+        """Return a result to the pool; the caller must drop its reference."""
+        result.food_item = None
+        result.metadata = None
+        result._dict_cache = None
+        self._stack.append(result)
+
+    @contextmanager
+    def lease(self, food_item: FoodItem, similarity_score: float,
+              metadata: Dict[str, Any]):
+        """Context-managed acquire/release around one result's lifetime."""
+        result = self.acquire(food_item, similarity_score, metadata)
+        try:
+            yield result
+        finally:
+            self.release(result)
+
+# Stable integer codes for cuisines, used by the SoA store below. int8
+# covers the enum comfortably and keeps the column 8x smaller than object refs.
+_CUISINE_INDEX: Dict[CuisineType, int] = {c: i for i, c in enumerate(CuisineType)}
+_CUISINE_BY_INDEX: List[CuisineType] = list(CuisineType)
+
+class FoodItemStore:
+    """
+    Structure-of-arrays store for batch scoring over the food catalog.
+
+    Per-object FoodItem instances scatter fields across the heap; this store
+    keeps cuisines, calories and embeddings in contiguous typed arrays so
+    ranking runs as one matrix-vector product instead of N attribute chases.
+    FoodItem/SearchResult objects should be materialized only for the final
+    top-k rows.
+
+    Attributes:
+        names: Food names, aligned with array rows
+        cuisines: int8 cuisine codes (indices into _CUISINE_BY_INDEX)
+        calories: int32 calories per serving
+        embeddings: float32 (N, D) embedding matrix, or None before the
+                    first batch with embeddings is added
+    """
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.cuisines: np.ndarray = np.empty(0, dtype=np.int8)
+        self.calories: np.ndarray = np.empty(0, dtype=np.int32)
+        self.embeddings: Optional[np.ndarray] = None
+        self._by_cuisine: Optional[Dict[CuisineType, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add_batch(self, items: List[FoodItem],
+                  embeddings: Optional[np.ndarray] = None) -> None:
+        """
+        Append a batch of food items (and optionally their embeddings).
+
+        Either every batch carries embeddings or none does — mixing the
+        two would silently misalign the embedding matrix with the columns,
+        so inconsistent batches are rejected up front.
+
+        Args:
+            items: Food items to add
+            embeddings: Optional (len(items), D) embedding rows, aligned
+                        with items
+
+        Raises:
+            ValueError: If embeddings are misaligned with items, or if a
+                       batch omits embeddings where earlier ones provided
+                       them (or vice versa)
+        """
+        if embeddings is not None:
+            rows = np.asarray(embeddings, dtype=np.float32)
+            if len(rows) != len(items):
+                raise ValueError(
+                    f"Embedding rows ({len(rows)}) must align with items ({len(items)})"
+                )
+            if self.embeddings is None and self.names:
+                raise ValueError(
+                    "Cannot add embeddings to a store populated without them"
+                )
+        elif self.embeddings is not None:
+            raise ValueError(
+                "This store holds embeddings; every batch must provide them"
+            )
+
+        self.names.extend(item.name for item in items)
+        self.cuisines = np.concatenate([
+            self.cuisines,
+            np.fromiter((_CUISINE_INDEX[item.cuisine] for item in items),
+                        dtype=np.int8, count=len(items))
+        ])
+        self.calories = np.concatenate([
+            self.calories,
+            np.fromiter((item.calories for item in items),
+                        dtype=np.int32, count=len(items))
+        ])
+        if embeddings is not None:
+            self.embeddings = rows if self.embeddings is None else np.vstack(
+                [self.embeddings, rows]
+            )
+        self._by_cuisine = None  # Partition map is stale after new rows
+
+    def cuisine_of(self, index: int) -> CuisineType:
+        """Decode the cuisine enum for a given row index."""
+        return _CUISINE_BY_INDEX[int(self.cuisines[index])]
+
+    @property
+    def by_cuisine(self) -> Dict[CuisineType, np.ndarray]:
+        """
+        Row indices partitioned by cuisine, built lazily after loads.
+
+        Cuisine-filtered queries score only their partition's submatrix —
+        roughly 1/|cuisines| of the work — instead of ranking the whole
+        catalog and filtering afterwards.
+        """
+        if self._by_cuisine is None:
+            self._by_cuisine = {
+                _CUISINE_BY_INDEX[code]: np.nonzero(self.cuisines == code)[0]
+                for code in np.unique(self.cuisines)
+            }
+        return self._by_cuisine
+
+    def topk(self, query_vec: np.ndarray, k: int,
+             cuisine: Optional[CuisineType] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank items against a query embedding in one GEMV.
+
+        Args:
+            query_vec: Query embedding (D,)
+            k: Number of top rows to return
+            cuisine: Optional cuisine partition to restrict scoring to
+
+        Returns:
+            Tuple of (row indices, scores), both ranked best-first; indices
+            always refer to the full store, even when a partition is scored
+        """
+        if self.embeddings is None or len(self.embeddings) == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        if cuisine is None:
+            return cosine_topk(self.embeddings, query_vec, k)
+        rows = self.by_cuisine.get(cuisine)
+        if rows is None or len(rows) == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        order, scores = cosine_topk(self.embeddings[rows], query_vec, k)
+        return rows[order], scores
+
+# Precompiled intent patterns, checked in order. A compiled regex routes
+# commands and comparison phrasing in O(len(text)) C code, so the fixed
+# intent set never needs a model call to classify. Command patterns are
+# anchored to whole inputs (plus explicit question forms for help) so
+# ordinary food queries mentioning 'how' or 'history' still search.
+_INTENT_PATTERNS: List[Tuple[str, 're.Pattern[str]']] = [
+    ("quit", re.compile(r"^\s*(quit|exit|bye|stop)\s*$", re.IGNORECASE)),
+    ("help", re.compile(r"^\s*(help|\?)\s*$|^\s*how\s+(do|can)\s+i\b", re.IGNORECASE)),
+    ("history", re.compile(r"^\s*(history|show\s+history|previous\s+searches)\s*$", re.IGNORECASE)),
+    ("compare", re.compile(r"\b(compare|vs\.?|versus|difference)\b", re.IGNORECASE)),
+]
+
+def classify_intent(text: str) -> Literal["search", "compare", "help", "history", "quit"]:
+    """
+    Classify query intent with precompiled patterns.
+
+    Args:
+        text: Raw query text
+
+    Returns:
+        The matched intent, or "search" when no pattern applies
+    """
+    for intent, pattern in _INTENT_PATTERNS:
+        if pattern.search(text):
+            return intent
+    return "search"
 
 @dataclass
 class UserQuery:
     """
     Structured representation of a user query.
-    
+
     Attributes:
         text: The original query text
         intent: Detected intent (search, compare, help, etc.)
@@ -161,9 +551,13 @@ class UserQuery:
     intent: Literal["search", "compare", "help", "history", "quit"] = "search"
     filters: Optional[Dict[str, Any]] = None
     context: Optional[Dict[str, Any]] = None
-    
+
     def __post_init__(self):
-        """Initialize default values."""
+        """Initialize default values and classify unlabelled intent."""
+        # Callers that pass an explicit non-default intent keep it; the
+        # default "search" is refined through the pattern classifier
+        if self.intent == "search":
+            self.intent = classify_intent(self.text)
         if self.filters is None:
             self.filters = {}
         if self.context is None:
@@ -175,70 +569,314 @@ class ConversationContext:
     Context for conversational interactions.
     
     Attributes:
-        history: List of previous queries
+        history: Bounded queue of previous queries (most recent last)
         preferences: User preferences
         session_id: Unique session identifier
         timestamp: Session start time
     """
-    history: List[str]
+    history: Deque[str]
     preferences: Dict[str, Any]
     session_id: str
     timestamp: float
-    
+
+    def __post_init__(self):
+        """Coerce the history into a bounded deque."""
+        # deque(maxlen=...) drops the oldest entry in O(1) on append, so
+        # add_query never re-slices and copies the list
+        if not isinstance(self.history, deque) or self.history.maxlen != MAX_CONVERSATION_HISTORY:
+            self.history = deque(self.history, maxlen=MAX_CONVERSATION_HISTORY)
+
     def add_query(self, query: str) -> None:
         """Add a query to the conversation history."""
         self.history.append(query)
-        # Keep only last 10 queries for memory efficiency
-        if len(self.history) > 10:
-            self.history = self.history[-10:]
 
-@dataclass
-class SystemConfig:
+# Shared immutable default generation parameters: every SystemConfig()
+# that doesn't override them references this one read-only mapping
+# instead of allocating a fresh dict in __post_init__.
+_DEFAULT_GEN_PARAMS: Mapping[str, Union[int, float, bool]] = MappingProxyType({
+    "max_length": 400,
+    "temperature": 0.7,
+    "do_sample": True,
+    "top_p": 0.9
+})
+
+if msgspec is not None:
+    class SystemConfig(msgspec.Struct, frozen=True):
+        """
+        System configuration parameters.
+
+        A frozen msgspec.Struct: instantiation and JSON round-tripping run
+        in C, and immutability makes hash-based config caching safe. Use
+        load_system_config() to decode and apply defaults.
+
+        Attributes:
+            embedding_model: Name of the embedding model
+            llm_model: Name of the language model
+            max_results: Maximum search results to return
+            similarity_threshold: Minimum similarity score
+            generation_params: LLM generation parameters (read-only default
+                               shared across instances)
+        """
+        embedding_model: str = "all-MiniLM-L6-v2"
+        llm_model: str = "google/flan-t5-base"
+        max_results: int = 5
+        similarity_threshold: float = 0.3
+        # default_factory fills the shared defaults on direct construction
+        # too, matching the dataclass __post_init__ contract
+        generation_params: Dict[str, Union[int, float, bool]] = msgspec.field(
+            default_factory=lambda: dict(_DEFAULT_GEN_PARAMS)
+        )
+else:
+    @dataclass
+    class SystemConfig:
+        """
+        System configuration parameters.
+
+        Attributes:
+            embedding_model: Name of the embedding model
+            llm_model: Name of the language model
+            max_results: Maximum search results to return
+            similarity_threshold: Minimum similarity score
+            generation_params: LLM generation parameters (read-only default
+                               shared across instances)
+        """
+        embedding_model: str = "all-MiniLM-L6-v2"
+        llm_model: str = "google/flan-t5-base"
+        max_results: int = 5
+        similarity_threshold: float = 0.3
+        generation_params: Optional[Mapping[str, Union[int, float, bool]]] = None
+
+        def __post_init__(self):
+            """Apply the shared default generation parameters."""
+            if self.generation_params is None:
+                self.generation_params = _DEFAULT_GEN_PARAMS
+
+def load_system_config(data: Union[bytes, str, Dict[str, Any], None] = None) -> SystemConfig:
     """
-    System configuration parameters.
-    
-    Attributes:
-        embedding_model: Name of the embedding model
-        llm_model: Name of the language model
-        max_results: Maximum search results to return
-        similarity_threshold: Minimum similarity score
-        generation_params: LLM generation parameters
-    """
-    embedding_model: str = "all-MiniLM-L6-v2"
-    llm_model: str = "google/flan-t5-base"
-    max_results: int = 5
-    similarity_threshold: float = 0.3
-    generation_params: Optional[Dict[str, Union[int, float, bool]]] = None
-    
-    def __post_init__(self):
-        """Initialize default generation parameters."""
-        if self.generation_params is None:
-            self.generation_params = {
-                "max_length": 400,
-                "temperature": 0.7,
-                "do_sample": True,
-                "top_p": 0.9
-            }
+    Build a SystemConfig from JSON bytes/text, a dict, or defaults.
+
+    With msgspec installed, decoding and validation run through the
+    compiled schema in one call; otherwise the dataclass constructor is
+    fed the known fields.
+
+    Args:
+        data: JSON document, parsed dict, or None for pure defaults
+
+    Returns:
+        A SystemConfig with generation_params defaults applied
+    """
+    if msgspec is not None:
+        if data is None:
+            return SystemConfig()
+        if isinstance(data, (bytes, str)):
+            raw = data if isinstance(data, bytes) else data.encode('utf-8')
+            return msgspec.json.decode(raw, type=SystemConfig)
+        return msgspec.convert(data, SystemConfig, strict=False)
+
+    if isinstance(data, (bytes, str)):
+        data = loads_json(data)
+    fields = {key: value for key, value in (data or {}).items()
+              if key in ('embedding_model', 'llm_model', 'max_results',
+                         'similarity_threshold', 'generation_params')}
+    return SystemConfig(**fields)
 
 # =============================================================================
 # Protocol Definitions (Interfaces)
 # =============================================================================
 
+# These Protocols are intentionally NOT @runtime_checkable: they exist for
+# static typing only. runtime_checkable isinstance() does a structural
+# attribute scan per check, which is needless overhead on hot paths —
+# implementations are dispatched by duck typing instead.
+
 class EmbeddingModel(Protocol):
     """Protocol for embedding models."""
-    
-    def encode(self, texts: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
-        """Encode text(s) into embeddings."""
+
+    def encode(self, texts: Union[str, List[str]]) -> np.ndarray:
+        """Encode text(s) into a contiguous float32 embedding array."""
         ...
 
+class CachedEmbeddingModel:
+    """
+    Content-hash cache wrapped around any EmbeddingModel.
+
+    Repeated queries are common in a recommender UI; hashing the normalized
+    text lets casing/whitespace variants share one cached vector, and batch
+    calls only hit the underlying encoder for the texts not yet seen.
+
+    Attributes:
+        max_entries: LRU capacity; the least recently used vector is
+                     evicted once exceeded
+    """
+
+    def __init__(self, model: EmbeddingModel, max_entries: int = 4096):
+        self._model = model
+        self._cache: 'OrderedDict[bytes, np.ndarray]' = OrderedDict()
+        self.max_entries = max_entries
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Hash normalized text into a compact, fixed-size cache key."""
+        normalized = ' '.join(text.lower().split())
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+
+    def encode(self, texts: Union[str, List[str]]) -> Union[np.ndarray, List[np.ndarray]]:
+        """
+        Encode text(s), serving repeats from the cache.
+
+        Args:
+            texts: A string or list of strings to embed
+
+        Returns:
+            A single vector for string input, or a list of vectors aligned
+            with the input list
+        """
+        single = isinstance(texts, str)
+        items = [texts] if single else list(texts)
+        keys = [self._key(text) for text in items]
+
+        vectors: List[Optional[np.ndarray]] = []
+        miss_positions: List[int] = []
+        for position, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            else:
+                miss_positions.append(position)
+            vectors.append(cached)
+
+        if miss_positions:
+            # One batched encode for all misses, stitched back in order
+            encoded = self._model.encode([items[p] for p in miss_positions])
+            rows = np.atleast_2d(np.asarray(encoded, dtype=np.float32))
+            for position, row in zip(miss_positions, rows):
+                vectors[position] = row
+                self._cache[keys[position]] = row
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        return vectors[0] if single else vectors
+
+class BatchedEmbeddingModel:
+    """
+    Length-bucketed batching wrapped around any EmbeddingModel.
+
+    Transformer encode cost scales with the padded batch length, so mixing
+    short and long texts in one batch wastes FLOPs on pad tokens. Sorting
+    by word count before splitting into batches keeps each batch's lengths
+    similar; results are un-permuted back to input order afterwards.
+    """
+
+    def __init__(self, model: EmbeddingModel,
+                 batch_size: Optional[int] = None):
+        self._model = model
+        self._batch_size = batch_size or MAX_EMBEDDING_BATCH_SIZE
+
+    def encode(self, texts: Union[str, List[str]]) -> Union[np.ndarray, List[np.ndarray]]:
+        """
+        Encode text(s) in length-sorted batches.
+
+        Args:
+            texts: A string or list of strings to embed
+
+        Returns:
+            A single vector for string input, or a list of vectors aligned
+            with the input list
+        """
+        if isinstance(texts, str):
+            return np.asarray(self._model.encode(texts), dtype=np.float32)
+
+        items = list(texts)
+        # Word count is a cheap proxy for token length — close enough to
+        # group similarly sized inputs without running the tokenizer twice
+        order = sorted(range(len(items)), key=lambda i: len(items[i].split()))
+
+        vectors: List[Optional[np.ndarray]] = [None] * len(items)
+        for start in range(0, len(order), self._batch_size):
+            batch_positions = order[start:start + self._batch_size]
+            encoded = self._model.encode([items[p] for p in batch_positions])
+            rows = np.atleast_2d(np.asarray(encoded, dtype=np.float32))
+            for position, row in zip(batch_positions, rows):
+                vectors[position] = row
+        return vectors
+
+class SQLiteEmbeddingCache:
+    """
+    Disk-persistent embedding cache keyed by content hash.
+
+    Catalog embeddings are stable between runs, so persisting them means a
+    restart reads float32 blobs from SQLite instead of re-running the
+    encoder. Vectors are stored as raw bytes and restored with
+    np.frombuffer; keys mix the model name into the hash so switching
+    models never serves stale vectors.
+
+    Example:
+        >>> cache = SQLiteEmbeddingCache()
+        >>> cache.put_many(["pasta"], [vector])
+        >>> cache.get("pasta") is not None
+        True
+    """
+
+    def __init__(self, db_path: Optional[str] = None,
+                 model_name: Optional[str] = None):
+        if db_path is None:
+            db_path = os.path.join(DEFAULT_CACHE_PATH, 'embeddings.db')
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._model_name = model_name or DEFAULT_EMBEDDING_MODEL
+        self._conn = sqlite3.connect(db_path)
+        # WAL + NORMAL trades a little durability on power loss for much
+        # higher write throughput — fine for a recomputable cache
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "hash BLOB PRIMARY KEY, model TEXT, dim INT, vec BLOB)"
+        )
+        self._conn.commit()
+
+    def _key(self, text: str) -> bytes:
+        """Hash model name + text into the cache key."""
+        payload = self._model_name + "\0" + text
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached vector for a text, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT vec FROM embeddings WHERE hash = ?", (self._key(text),)
+        ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Return cached vectors aligned with texts (None per miss)."""
+        return [self.get(text) for text in texts]
+
+    def put_many(self, texts: List[str], vectors: List[np.ndarray]) -> None:
+        """Store vectors for their texts in one batched insert."""
+        rows = []
+        for text, vector in zip(texts, vectors):
+            array = np.asarray(vector, dtype=np.float32)
+            rows.append((self._key(text), self._model_name,
+                         int(array.shape[-1]), array.tobytes()))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (hash, model, dim, vec) "
+            "VALUES (?, ?, ?, ?)", rows
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
 class VectorDatabase(Protocol):
     """Protocol for vector database operations."""
     
-    def add_documents(self, documents: List[str], embeddings: List[List[float]], metadata: List[Dict[str, Any]]) -> None:
-        """Add documents to the database."""
+    def add_documents(self, documents: List[str], embeddings: np.ndarray, metadata: List[Dict[str, Any]]) -> None:
+        """Add documents with their (N, D) float32 embeddings."""
         ...
-    
-    def search(self, query_embedding: List[float], k: int) -> List[SearchResult]:
+
+    def search(self, query_embedding: np.ndarray, k: int) -> List[SearchResult]:
         """Search for similar documents."""
         ...
 
@@ -253,11 +891,14 @@ class LanguageModel(Protocol):
 # Type Aliases
 # =============================================================================
 
-# Common type aliases for better readability
+# Common type aliases for better readability. Embeddings are contiguous
+# float32 ndarrays, not lists of boxed Python floats — a 384-dim vector is
+# ~1.5 KB as float32 vs ~11 KB as a list, and the array form is what BLAS
+# and the scoring kernels operate on directly.
 FoodDataset = List[FoodItemDict]
 SearchResults = List[SearchResultDict]
-EmbeddingVector = List[float]
-EmbeddingMatrix = List[List[float]]
+EmbeddingVector = npt.NDArray[np.float32]
+EmbeddingMatrix = npt.NDArray[np.float32]
 QueryText = str
 ResponseText = str
 CollectionMetadata = Dict[str, Any]
@@ -268,36 +909,168 @@ EmbeddingFunction = Callable[[Union[str, List[str]]], Union[EmbeddingVector, Emb
 GenerationFunction = Callable[[str], str]
 SearchFunction = Callable[[QueryText, int], SearchResults]
 
+# =============================================================================
+# Serialization Helpers
+# =============================================================================
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+
+    Uses orjson when installed — its numpy option serializes embedding
+    arrays directly, so callers never need a .tolist() copy first — and
+    falls back to stdlib json otherwise.
+
+    Args:
+        obj: Object to serialize (dicts, lists, scalars, numpy arrays)
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=lambda o: o.tolist() if isinstance(o, np.ndarray) else o).encode('utf-8')
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON bytes or text into Python objects.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # =============================================================================
 # Validation Functions
 # =============================================================================
 
-def validate_food_item(item: Dict[str, Any]) -> bool:
+# Compiled validation schemas. msgspec checks presence and types in C; the
+# Python functions below keep only the value constraints (non-empty fields,
+# score/limit ranges) that a structural schema cannot express, and fall
+# back to plain dict probing when msgspec is unavailable.
+if msgspec is not None:
+    class _FoodItemSchema(msgspec.Struct):
+        food_name: str
+        cuisine_type: str
+        food_description: str
+
+    class _SearchResultSchema(msgspec.Struct):
+        food_name: str
+        similarity_score: float
+
+    class _SystemConfigSchema(msgspec.Struct):
+        embedding_model: str
+        llm_model: str
+        max_results: int
+
+# Required-field sets for the fallback validators, built once at import.
+# frozenset.issubset probes the dict in one C-level loop instead of
+# rebuilding a list and walking it per record.
+_FOOD_REQUIRED = frozenset(('food_name', 'cuisine_type', 'food_description'))
+_RESULT_REQUIRED = frozenset(('food_name', 'similarity_score'))
+_CONFIG_REQUIRED = frozenset(('embedding_model', 'llm_model', 'max_results'))
+
+def _matches_schema(data: Dict[str, Any], schema: type) -> bool:
+    """Check a dictionary against a msgspec schema, ignoring extra keys."""
+    try:
+        msgspec.convert(data, schema, strict=False)
+        return True
+    except msgspec.ValidationError:
+        return False
+
+# Seen food names for bulk-load duplicate rejection. A Bloom filter keeps
+# the probe O(1) at fixed memory when available; a plain set is the
+# fallback (exact, slightly more memory).
+_name_filter = (BloomFilter(capacity=100_000, error_rate=0.001)
+                if BloomFilter is not None else set())
+
+def reset_duplicate_filter() -> None:
+    """Forget all food names seen by duplicate-rejecting validation."""
+    global _name_filter
+    _name_filter = (BloomFilter(capacity=100_000, error_rate=0.001)
+                    if BloomFilter is not None else set())
+
+def validate_food_item(item: Dict[str, Any], reject_duplicates: bool = False) -> bool:
     """
     Validate if a dictionary represents a valid food item.
-    
+
     Args:
         item: Dictionary to validate
-        
+        reject_duplicates: When True, a food name already seen by a
+                          previous duplicate-rejecting call fails
+                          validation (for bulk catalog merges)
+
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ['food_name', 'cuisine_type', 'food_description']
-    return all(field in item and item[field] for field in required_fields)
+    if msgspec is not None:
+        valid = (_matches_schema(item, _FoodItemSchema) and
+                 bool(item['food_name'] and item['cuisine_type'] and item['food_description']))
+    else:
+        valid = (_FOOD_REQUIRED.issubset(item) and
+                 all(item[field] for field in _FOOD_REQUIRED))
+    if valid and reject_duplicates:
+        name_key = item['food_name'].strip().lower()
+        if name_key in _name_filter:
+            return False
+        _name_filter.add(name_key)
+    return valid
+
+def validate_food_dataset(items: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Validate a whole dataset in one vectorized pass.
+
+    Per-record validate_food_item() calls cost N Python function
+    invocations; loading the records into a DataFrame evaluates every
+    required-field predicate column-wise in C instead.
+
+    Args:
+        items: Food item dictionaries to validate
+
+    Returns:
+        Boolean mask aligned with items (True = valid)
+    """
+    if not items:
+        return np.empty(0, dtype=bool)
+
+    # Deferred import: pandas is only needed for bulk loads
+    import pandas as pd
+
+    df = pd.DataFrame(items)
+
+    def nonempty(name: str) -> np.ndarray:
+        if name not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        col = df[name]
+        present = col.notna().to_numpy()
+        text = col.fillna('').astype(str).str.strip()
+        return present & (text.str.len() > 0).to_numpy()
+
+    mask = np.ones(len(df), dtype=bool)
+    for required in _FOOD_REQUIRED:
+        mask &= nonempty(required)
+    return mask
 
 def validate_search_result(result: Dict[str, Any]) -> bool:
     """
     Validate if a dictionary represents a valid search result.
-    
+
     Args:
         result: Dictionary to validate
-        
+
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ['food_name', 'similarity_score']
+    if msgspec is not None:
+        return (_matches_schema(result, _SearchResultSchema) and
+                0.0 <= result['similarity_score'] <= 1.0)
     return (
-        all(field in result for field in required_fields) and
+        _RESULT_REQUIRED.issubset(result) and
         isinstance(result['similarity_score'], (int, float)) and
         0.0 <= result['similarity_score'] <= 1.0
     )
@@ -305,16 +1078,19 @@ def validate_search_result(result: Dict[str, Any]) -> bool:
 def validate_system_config(config: Dict[str, Any]) -> bool:
     """
     Validate system configuration parameters.
-    
+
     Args:
         config: Configuration dictionary to validate
-        
+
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ['embedding_model', 'llm_model', 'max_results']
+    if msgspec is not None:
+        return (_matches_schema(config, _SystemConfigSchema) and
+                isinstance(config['max_results'], int) and
+                config['max_results'] > 0)
     return (
-        all(field in config for field in required_fields) and
+        _CONFIG_REQUIRED.issubset(config) and
         isinstance(config['max_results'], int) and
         config['max_results'] > 0
     )